@@ -588,6 +588,18 @@ class TestProjectPushHandler:
 
         formatter_instance.print_error_panel.assert_called_once_with("Failed to push definition: API unavailable")
 
+    def test_push_definition_closes_resource_files(self, mocker):
+        handler = ProjectPushHandler()
+        mocker.patch("weni_cli.commands.project_push.Formatter")
+        mock_client = mocker.patch("weni_cli.commands.project_push.CLIClient")
+        mock_client.return_value.push_agents.side_effect = Exception("API unavailable")
+        resources = {"agent:tool": mocker.Mock(), "agent:other_tool": mocker.Mock()}
+
+        handler.push_definition(False, "passive", "project-uuid", VALID_PASSIVE_DEFINITION, resources)
+
+        for resource_file in resources.values():
+            resource_file.close.assert_called_once()
+
 
 @requests_mock.Mocker(kw="requests_mock")
 def test_project_push_active_agent(mocker, create_active_agent_files, mock_cli_response, mock_store_values, **kwargs):
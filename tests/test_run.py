@@ -1,10 +1,13 @@
 import os
 import pytest
 import io
+import threading
 from click.testing import CliRunner
+from rich.console import Console
+from rich.text import Text
 
 from weni_cli.cli import cli
-from weni_cli.commands.run import RunHandler, DEFAULT_TEST_DEFINITION_FILE
+from weni_cli.commands.run import RunHandler, DEFAULT_TEST_DEFINITION_FILE, LIVE_RESPONSE_MAX_LENGTH, build_tool_index
 from weni_cli.clients.cli_client import CLIClient
 
 
@@ -437,19 +440,27 @@ def test_get_tool_source_path_success():
     with runner.isolated_filesystem():
         handler = RunHandler()
         definition = {
-            "agents": {"get_address": {"tools": [{"key": "get_address", "source": {"path": "tools/get_address"}}]}}
+            "agents": {"get_address": {"tools": [{"get_address": {"source": {"path": "tools/get_address"}}}]}}
         }
-        path = handler.get_tool_source_path(definition, "get_address", "get_address")
+        path = handler.get_tool_source_path(build_tool_index(definition), "get_address", "get_address")
         assert path == "tools/get_address"
 
 
+def test_get_tool_source_path_with_null_source():
+    """Test get_tool_source_path when the tool declares an explicit null source."""
+    handler = RunHandler()
+    definition = {"agents": {"get_address": {"tools": [{"get_address": {"source": None}}]}}}
+    path = handler.get_tool_source_path(build_tool_index(definition), "get_address", "get_address")
+    assert path is None
+
+
 def test_get_tool_source_path_failure():
     """Test get_tool_source_path with invalid input."""
     runner = CliRunner()
     with runner.isolated_filesystem():
         handler = RunHandler()
         definition = {"agents": {}}
-        path = handler.get_tool_source_path(definition, "nonexistent", "nonexistent")
+        path = handler.get_tool_source_path(build_tool_index(definition), "nonexistent", "nonexistent")
         assert path is None
 
 
@@ -460,10 +471,10 @@ def test_get_tool_source_path_agent_exists_but_tool_not_found():
         handler = RunHandler()
         definition = {
             "agents": {
-                "get_address": {"tools": [{"key": "different_tool", "source": {"path": "tools/different_tool"}}]}
+                "get_address": {"tools": [{"different_tool": {"source": {"path": "tools/different_tool"}}}]}
             }
         }
-        result = handler.get_tool_source_path(definition, "get_address", "get_address")
+        result = handler.get_tool_source_path(build_tool_index(definition), "get_address", "get_address")
         assert result is None
 
 
@@ -474,11 +485,11 @@ def test_load_tool_credentials_success(mocker):
         handler = RunHandler()
 
         # Mock the open function to return a file with credentials
-        mock_open = mocker.patch("builtins.open", mocker.mock_open(read_data="API_KEY=test_key\nSECRET=test_secret\n"))
+        mock_open = mocker.patch("builtins.open", mocker.mock_open(read_data=b"API_KEY=test_key\nSECRET=test_secret\n"))
 
         credentials = handler.load_tool_credentials("path/to/tool")
         assert credentials == {"API_KEY": "test_key", "SECRET": "test_secret"}
-        mock_open.assert_called_once_with("path/to/tool/.env", "r")
+        mock_open.assert_called_once_with("path/to/tool/.env", "rb")
 
 
 def test_load_tool_credentials_failure(mocker):
@@ -492,7 +503,7 @@ def test_load_tool_credentials_failure(mocker):
 
         credentials = handler.load_tool_credentials("path/to/tool")
         assert credentials == {}
-        mock_open.assert_called_once_with("path/to/tool/.env", "r")
+        mock_open.assert_called_once_with("path/to/tool/.env", "rb")
 
 
 def test_load_tool_globals_success(mocker):
@@ -502,11 +513,11 @@ def test_load_tool_globals_success(mocker):
         handler = RunHandler()
 
         # Mock the open function to return a file with globals
-        mock_open = mocker.patch("builtins.open", mocker.mock_open(read_data="REGION=us-east-1\nLANGUAGE=en\n"))
+        mock_open = mocker.patch("builtins.open", mocker.mock_open(read_data=b"REGION=us-east-1\nLANGUAGE=en\n"))
 
         globals_dict = handler.load_tool_globals("path/to/tool")
         assert globals_dict == {"REGION": "us-east-1", "LANGUAGE": "en"}
-        mock_open.assert_called_once_with("path/to/tool/.globals", "r")
+        mock_open.assert_called_once_with("path/to/tool/.globals", "rb")
 
 
 def test_load_tool_globals_failure(mocker):
@@ -520,7 +531,7 @@ def test_load_tool_globals_failure(mocker):
 
         globals_dict = handler.load_tool_globals("path/to/tool")
         assert globals_dict == {}
-        mock_open.assert_called_once_with("path/to/tool/.globals", "r")
+        mock_open.assert_called_once_with("path/to/tool/.globals", "rb")
 
 
 def test_load_default_test_definition_success():
@@ -537,7 +548,7 @@ def test_load_default_test_definition_success():
                 }
             }
         }
-        path = handler.load_default_test_definition(definition, "get_address", "get_address")
+        path = handler.load_default_test_definition(build_tool_index(definition), "get_address", "get_address")
         assert path == "tools/get_address/custom_test.yaml"
 
 
@@ -549,7 +560,7 @@ def test_load_default_test_definition_no_path_test():
         definition = {
             "agents": {"get_address": {"tools": [{"get_address": {"source": {"path": "tools/get_address"}}}]}}
         }
-        path = handler.load_default_test_definition(definition, "get_address", "get_address")
+        path = handler.load_default_test_definition(build_tool_index(definition), "get_address", "get_address")
         assert path == f"tools/get_address/{DEFAULT_TEST_DEFINITION_FILE}"
 
 
@@ -559,7 +570,7 @@ def test_load_default_test_definition_failure():
     with runner.isolated_filesystem():
         handler = RunHandler()
         definition = {"agents": {}}
-        path = handler.load_default_test_definition(definition, "nonexistent", "nonexistent")
+        path = handler.load_default_test_definition(build_tool_index(definition), "nonexistent", "nonexistent")
         assert path is None
 
 
@@ -582,7 +593,7 @@ def test_load_tool_folder_success(mocker, create_mocked_files):
             }
         }
 
-        result, error = handler.load_tool_folder(definition, "get_address", "get_address")
+        result, error = handler.load_tool_folder(build_tool_index(definition), "get_address", "get_address")
         assert result is not None
         assert error is None
         mock_zip.assert_called_once_with("get_address", "tools/get_address")
@@ -594,7 +605,7 @@ def test_load_tool_folder_agent_not_found():
     with runner.isolated_filesystem():
         handler = RunHandler()
         definition = {"agents": {}}
-        result, error = handler.load_tool_folder(definition, "nonexistent", "get_address")
+        result, error = handler.load_tool_folder(build_tool_index(definition), "nonexistent", "get_address")
         assert result is None
         assert "Agent nonexistent not found in definition" in str(error)
 
@@ -605,7 +616,7 @@ def test_load_tool_folder_tool_not_found():
     with runner.isolated_filesystem():
         handler = RunHandler()
         definition = {"agents": {"get_address": {"tools": []}}}
-        result, error = handler.load_tool_folder(definition, "get_address", "nonexistent")
+        result, error = handler.load_tool_folder(build_tool_index(definition), "get_address", "nonexistent")
         assert result is None
         assert "Tool nonexistent not found in agent get_address" in str(error)
 
@@ -677,12 +688,65 @@ def test_load_tool_credentials_with_malformed_data(mocker):
         handler = RunHandler()
 
         # Mock the open function to return a file with malformed data (missing =)
-        mock_open = mocker.patch("builtins.open", mocker.mock_open(read_data="API_KEY:test_key\nSECRET=test_secret\n"))
+        mock_open = mocker.patch("builtins.open", mocker.mock_open(read_data=b"API_KEY:test_key\nSECRET=test_secret\n"))
 
-        # Should throw an exception that gets caught, returning empty dict
+        # The malformed line is skipped, the valid ones are still loaded
         credentials = handler.load_tool_credentials("path/to/tool")
-        assert credentials == {}
-        mock_open.assert_called_once_with("path/to/tool/.env", "r")
+        assert credentials == {"SECRET": "test_secret"}
+        mock_open.assert_called_once_with("path/to/tool/.env", "rb")
+
+
+def test_load_tool_credentials_with_comments_quotes_and_equals_in_values(mocker):
+    """Test load_tool_credentials skips comments and blank lines and keeps values containing '='."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        handler = RunHandler()
+
+        read_data = b'# credentials\n\nAPI_KEY="test_key"\nTOKEN=abc==\r\nEMPTY=\nURL = https://example.com/?a=1\n'
+        mocker.patch("builtins.open", mocker.mock_open(read_data=read_data))
+
+        credentials = handler.load_tool_credentials("path/to/tool")
+        assert credentials == {
+            "API_KEY": "test_key",
+            "TOKEN": "abc==",
+            "EMPTY": "",
+            "URL": "https://example.com/?a=1",
+        }
+
+
+def test_load_tool_credentials_only_strips_matching_quotes(mocker):
+    """Test load_tool_credentials unquotes matching single or double quotes and keeps unmatched ones."""
+    handler = RunHandler()
+    read_data = b"DOUBLE=\"a b\"\nSINGLE='c d'\nEMPTY=''\nOPEN=\"abc\nCLOSE=abc'\nMIXED=\"abc'\n"
+    mocker.patch("builtins.open", mocker.mock_open(read_data=read_data))
+
+    credentials = handler.load_tool_credentials("path/to/tool")
+    assert credentials == {
+        "DOUBLE": "a b",
+        "SINGLE": "c d",
+        "EMPTY": "",
+        "OPEN": '"abc',
+        "CLOSE": "abc'",
+        "MIXED": "\"abc'",
+    }
+
+
+@pytest.mark.parametrize("error", [PermissionError, IsADirectoryError])
+def test_load_tool_globals_unreadable_file(mocker, error):
+    """Test load_tool_globals returns an empty dict when the file cannot be read."""
+    handler = RunHandler()
+    mocker.patch("builtins.open", side_effect=error)
+
+    assert handler.load_tool_globals("path/to/tool") == {}
+
+
+def test_load_tool_globals_with_invalid_utf8(mocker):
+    """Test load_tool_globals keeps the readable entries when the file has invalid UTF-8 bytes."""
+    handler = RunHandler()
+    mocker.patch("builtins.open", mocker.mock_open(read_data=b"REGION=us-east-1\nNAME=caf\xe9\n"))
+
+    globals_dict = handler.load_tool_globals("path/to/tool")
+    assert globals_dict == {"REGION": "us-east-1", "NAME": "caf\ufffd"}
 
 
 def test_load_default_test_definition_exception_handling(mocker):
@@ -701,7 +765,7 @@ def test_load_default_test_definition_exception_handling(mocker):
         }
 
         # Call the method directly and check the result
-        result = handler.load_default_test_definition(definition, "get_address", "get_address")
+        result = handler.load_default_test_definition(build_tool_index(definition), "get_address", "get_address")
 
         # Verify the function returns None on exception
         assert result is None
@@ -726,7 +790,7 @@ def test_load_agent_resource_folder_zip_creation_failure(mocker):
         mocker.patch("weni_cli.commands.run.create_agent_resource_folder_zip", return_value=(None, "Failed to create agent resource folder for agent get_address"))
 
         # Call the method directly and check the result
-        result, error = handler.load_tool_folder(definition, "get_address", "get_address")
+        result, error = handler.load_tool_folder(build_tool_index(definition), "get_address", "get_address")
 
         # Verify the function returns None on failure
         assert result is None
@@ -760,6 +824,23 @@ def test_render_response_and_logs(capsys):
         assert "More log data" in captured.out
 
 
+def test_render_response_and_logs_prints_all_panels_at_once(mocker):
+    """Test render_reponse_and_logs writes every test panel in a single print call."""
+    handler = RunHandler()
+    console_mock = mocker.patch("rich.console.Console").return_value
+
+    logs = [
+        {"test_name": "Test 1", "test_logs": "Log data 1"},
+        {"test_name": "Test 2", "test_logs": "Log data 2"},
+        {"test_name": "Test 3"},
+    ]
+    handler.render_reponse_and_logs(logs)
+
+    assert console_mock.print.call_count == 2
+    panels = console_mock.print.call_args[0][0].renderables
+    assert len(panels) == 2
+
+
 def test_parse_agent_tool_with_empty_string():
     """Test parse_agent_tool method with an empty string."""
     runner = CliRunner()
@@ -815,7 +896,7 @@ def test_run_test_uses_new_methods(mocker):
 
         # This will replace the CLIClient constructor with our mock
         # Save the patch reference for later verification
-        mocker.patch("weni_cli.commands.run.CLIClient", return_value=client_mock)
+        mocker.patch("weni_cli.clients.cli_client.CLIClient", return_value=client_mock)
 
         # Mock the Live context manager
         live_context = mocker.MagicMock()
@@ -826,6 +907,9 @@ def test_run_test_uses_new_methods(mocker):
         # Mock display_test_results for verification - no need to save the reference
         mocker.patch.object(handler, "display_test_results", return_value="Test Table")
 
+        # Force the live table even though the test output is not a terminal
+        mocker.patch.object(handler, "use_live_display", return_value=True)
+
         # Call the handler method to be tested
         handler.run_test(
             "project_uuid",
@@ -845,6 +929,77 @@ def test_run_test_uses_new_methods(mocker):
         # Now verify that update_live_display was called
         assert update_mock.call_count > 0, "update_live_display was not called"
 
+        # The client callback arguments are forwarded positionally, the display context as keywords
+        update_mock.assert_called_once_with(
+            [],
+            "Test Name",
+            {"response": {"text": "Test result"}},
+            200,
+            "TEST_CASE_COMPLETED",
+            False,
+            live_display=live_mock,
+            display_label="Tool Name",
+            agent_type="passive",
+        )
+
+
+def test_run_test_prints_plain_lines_outside_a_terminal(mocker):
+    """Test that run_test skips the live table and prints one line per event when not in a terminal."""
+    handler = RunHandler()
+    mocker.patch.object(handler, "use_live_display", return_value=False)
+    display_mock = mocker.patch.object(handler, "display_test_results")
+    echo_mock = mocker.patch("weni_cli.commands.run.click.echo")
+
+    def fake_run_test(*args, **kwargs):
+        callback = args[9]
+        callback("Test Name", None, None, "TEST_CASE_RUNNING", False)
+        callback(
+            "Test Name",
+            {"response": {"functionResponse": {"responseBody": {"TEXT": {"body": "ok"}}}}},
+            200,
+            "TEST_CASE_COMPLETED",
+            False,
+        )
+        return []
+
+    client_mock = mocker.MagicMock()
+    client_mock.run_test.side_effect = fake_run_test
+    mocker.patch("weni_cli.clients.cli_client.CLIClient", return_value=client_mock)
+
+    handler.run_test("project_uuid", {}, b"tool_folder", "tool", "agent", {}, {}, {}, False)
+
+    display_mock.assert_not_called()
+    assert [call.args[0] for call in echo_mock.call_args_list] == ["Test Name: ⏳", "Test Name: ✅ ok"]
+
+
+def test_print_test_event_verbose_adds_the_status_code(mocker):
+    """Test that print_test_event adds the status code to completed events in verbose mode."""
+    handler = RunHandler()
+    echo_mock = mocker.patch("weni_cli.commands.run.click.echo")
+    test_result = {"response": {"functionResponse": {"responseBody": {"TEXT": {"body": "failed"}}}}}
+
+    handler.print_test_event("Test Name", None, None, "TEST_CASE_RUNNING", True)
+    handler.print_test_event("Test Name", test_result, 500, "TEST_CASE_COMPLETED", True)
+    handler.print_test_event("Test Name", test_result, 500, "TEST_CASE_COMPLETED", False)
+
+    assert [call.args[0] for call in echo_mock.call_args_list] == [
+        "Test Name: ⏳",
+        "Test Name: ❌ (status 500) failed",
+        "Test Name: ❌ failed",
+    ]
+
+
+def test_use_live_display_disabled_in_ci(mocker, monkeypatch):
+    """Test that the live display is disabled when running in CI, even on a terminal."""
+    handler = RunHandler()
+    mocker.patch("weni_cli.commands.run.sys.stdout").isatty.return_value = True
+
+    monkeypatch.delenv("CI", raising=False)
+    assert handler.use_live_display() is True
+
+    monkeypatch.setenv("CI", "true")
+    assert handler.use_live_display() is False
+
 
 def test_run_test_verbose_triggers_render_logs(mocker):
     """Test that run_test with verbose=True triggers the render_reponse_and_logs method."""
@@ -885,7 +1040,7 @@ def test_run_test_verbose_triggers_render_logs(mocker):
 
         # This will replace the CLIClient constructor with our mock
         # Save the patch reference for later verification
-        client_patch = mocker.patch("weni_cli.commands.run.CLIClient", return_value=client_mock)
+        client_patch = mocker.patch("weni_cli.clients.cli_client.CLIClient", return_value=client_mock)
 
         # Mock the Live context manager
         live_context = mocker.MagicMock()
@@ -916,6 +1071,13 @@ def test_run_test_verbose_triggers_render_logs(mocker):
         render_mock.assert_called_once_with(test_logs, agent_type="passive")
 
 
+def test_parse_agent_tool_with_extra_or_missing_parts():
+    """Test parse_agent_tool keeps the first two parts and rejects a missing tool."""
+    handler = RunHandler()
+    assert handler.parse_agent_tool("agent.tool.extra") == ("agent", "tool")
+    assert handler.parse_agent_tool("agent.") == (None, None)
+
+
 def test_parse_agent_tool_with_out_of_bounds_index():
     """Test parse_agent_tool method with an index error."""
     runner = CliRunner()
@@ -935,7 +1097,7 @@ def test_display_test_results_comprehensive(mocker):
 
         # Mock Table and its instance methods
         table_mock = mocker.MagicMock()
-        mocker.patch("weni_cli.commands.run.Table", return_value=table_mock)
+        mocker.patch("rich.table.Table", return_value=table_mock)
 
         # Test with empty rows
         result = handler.display_test_results([], "Test Tool")
@@ -971,15 +1133,74 @@ def test_display_test_results_comprehensive(mocker):
 
         # Verify table row content
         row_calls = table_mock.add_row.call_args_list
-        assert row_calls[0][0][0] == "Test 1"  # Test name
-        assert row_calls[0][0][1] == "✅"  # Status icon for success
-        assert row_calls[0][0][2] == "Formatted: Response 1"  # Formatted response
+        assert row_calls[0][0][0].plain == "Test 1"  # Test name
+        assert row_calls[0][0][1].plain == "✅"  # Status icon for success
+        assert row_calls[0][0][2].plain == "Formatted: Response 1"  # Formatted response
+
+        assert row_calls[1][0][0].plain == "Test 2"  # Test name
+        assert row_calls[1][0][1].plain == "❌"  # Status icon for error
+
+        assert row_calls[2][0][0].plain == "Test 3"  # Test name
+        assert row_calls[2][0][1].plain == "⏳"  # Running icon for in-progress
+
+
+def test_display_test_results_uses_precomputed_response_display(mocker):
+    """Test display_test_results does not format responses again when the row already has them."""
+    handler = RunHandler()
+    table_mock = mocker.MagicMock()
+    mocker.patch("rich.table.Table", return_value=table_mock)
+    format_mock = mocker.patch.object(handler, "format_response_for_display")
+
+    rows = [
+        {
+            "name": "Test 1",
+            "status": 200,
+            "response": {"response": {}},
+            "code": "TEST_CASE_COMPLETED",
+            "response_display": "Precomputed",
+        }
+    ]
+    handler.display_test_results(rows, "Test Tool")
+
+    format_mock.assert_not_called()
+    assert table_mock.add_row.call_args[0][2].plain == "Precomputed"
+
+
+def test_display_test_results_renders_none_values_as_empty_cells(mocker):
+    """Test display_test_results shows an empty cell instead of failing when a row has no response."""
+    handler = RunHandler()
+    table_mock = mocker.MagicMock()
+    mocker.patch("rich.table.Table", return_value=table_mock)
+    mocker.patch.object(handler, "format_response_for_display", return_value=None)
+
+    rows = [{"name": None, "status": 200, "response": None, "code": "TEST_CASE_COMPLETED"}]
+    handler.display_test_results(rows, "Test Tool")
+
+    name_cell, _, response_cell = table_mock.add_row.call_args[0]
+    assert name_cell.plain == ""
+    assert response_cell.plain == ""
 
-        assert row_calls[1][0][0] == "Test 2"  # Test name
-        assert row_calls[1][0][1] == "❌"  # Status icon for error
 
-        assert row_calls[2][0][0] == "Test 3"  # Test name
-        assert row_calls[2][0][1] == "⏳"  # Running icon for in-progress
+def test_display_test_results_keeps_brackets_in_responses_literal(mocker):
+    """Test display_test_results passes Text cells so response text is never parsed as Rich markup."""
+    handler = RunHandler()
+    table_mock = mocker.MagicMock()
+    mocker.patch("rich.table.Table", return_value=table_mock)
+
+    rows = [
+        {
+            "name": "Test 1",
+            "status": 200,
+            "response": {"response": {}},
+            "code": "TEST_CASE_COMPLETED",
+            "response_display": "[bold]not markup[/bold] :smile:",
+        }
+    ]
+    handler.display_test_results(rows, "Test Tool")
+
+    response_cell = table_mock.add_row.call_args[0][2]
+    assert isinstance(response_cell, Text)
+    assert response_cell.plain == "[bold]not markup[/bold] :smile:"
 
 
 def test_update_live_display_add_new_row(mocker):
@@ -1014,12 +1235,13 @@ def test_update_live_display_add_new_row(mocker):
         assert test_rows[0]["status"] == 200
         assert test_rows[0]["response"] == "Response 1"
         assert test_rows[0]["code"] == "TEST_CASE_COMPLETED"
+        assert test_rows[0]["response_display"] == "Response 1"
 
         # Verify that the display method was called correctly
         display_mock.assert_called_once_with(test_rows, "Test Tool", agent_type="passive", verbose=False)
 
-        # Verify that the live display was updated
-        live_mock.update.assert_called_once_with("Test Table", refresh=True)
+        # Verify that the live display was updated, Live repaints on its own refresh cycle
+        live_mock.update.assert_called_once_with("Test Table")
 
 
 def test_update_live_display_update_existing_row(mocker):
@@ -1054,12 +1276,161 @@ def test_update_live_display_update_existing_row(mocker):
         assert test_rows[0]["status"] == 400  # Updated status
         assert test_rows[0]["response"] == "Updated Response"  # Updated response
         assert test_rows[0]["code"] == "TEST_CASE_COMPLETED"  # Updated code
+        assert test_rows[0]["response_display"] == "Updated Response"  # Updated formatted response
 
         # Verify that the display method was called correctly
         display_mock.assert_called_once_with(test_rows, "Test Tool", agent_type="passive", verbose=False)
 
-        # Verify that the live display was updated
-        live_mock.update.assert_called_once_with("Test Table", refresh=True)
+        # Verify that the live display was updated, Live repaints on its own refresh cycle
+        live_mock.update.assert_called_once_with("Test Table")
+
+
+def test_update_live_display_reuses_table_and_updates_changed_cells(mocker):
+    """Test the live table is built once and later events only rewrite the cells of changed rows."""
+    handler = RunHandler()
+    live_mock = mocker.MagicMock()
+    display_spy = mocker.spy(handler, "display_test_results")
+
+    test_rows = []
+    events = [
+        ("Test 1", None, None, "TEST_CASE_RUNNING"),
+        ("Test 1", "Response 1", 200, "TEST_CASE_COMPLETED"),
+        ("Test 2", None, None, "TEST_CASE_RUNNING"),
+    ]
+    for test_name, test_result, status_code, code in events:
+        handler.update_live_display(
+            test_rows,
+            test_name,
+            test_result,
+            status_code,
+            code,
+            live_display=live_mock,
+            display_label="Test Tool",
+        )
+
+    assert display_spy.call_count == 1
+    table = live_mock.update.call_args[0][0]
+    assert all(call.args[0] is table for call in live_mock.update.call_args_list)
+    assert table.row_count == 2
+    assert [cell.plain for cell in table.columns[0]._cells] == ["Test 1", "Test 2"]
+    assert [cell.plain for cell in table.columns[1]._cells] == ["✅", "⏳"]
+    assert [cell.plain for cell in table.columns[2]._cells] == ["Response 1", "waiting..."]
+    assert handler._live_row_index == {"Test 1": 0, "Test 2": 1}
+
+
+def test_update_live_display_changes_the_table_under_the_live_lock(mocker):
+    """Test the shown table is only changed while holding Live's lock, so a repaint never sees half a row."""
+    handler = RunHandler()
+    live_mock = mocker.MagicMock()
+    live_mock._lock = threading.Lock()
+
+    lock_held = []
+    build_result_cells = handler._build_result_cells
+
+    def record_lock(*args, **kwargs):
+        lock_held.append(live_mock._lock.locked())
+        return build_result_cells(*args, **kwargs)
+
+    mocker.patch.object(handler, "_build_result_cells", side_effect=record_lock)
+
+    test_rows = []
+    events = [
+        ("Test 1", None, None, "TEST_CASE_RUNNING"),
+        ("Test 1", "Response 1", 200, "TEST_CASE_COMPLETED"),
+        ("Test 2", None, None, "TEST_CASE_RUNNING"),
+    ]
+    for test_name, test_result, status_code, code in events:
+        handler.update_live_display(
+            test_rows,
+            test_name,
+            test_result,
+            status_code,
+            code,
+            live_display=live_mock,
+            display_label="Test Tool",
+        )
+
+    # the first event builds a table Live is not showing yet, the rewritten and the appended row happen under the lock
+    assert lock_held == [False, True, True]
+    assert not live_mock._lock.locked()
+
+
+def test_update_live_display_rewritten_cells_are_rendered(mocker):
+    """Test Rich renders the rewritten cells, so a change to how Rich stores column cells is caught."""
+    handler = RunHandler()
+    live_mock = mocker.MagicMock()
+
+    test_rows = []
+    for test_result, status_code, code in ((None, None, "TEST_CASE_RUNNING"), ("Response 1", 200, "TEST_CASE_COMPLETED")):
+        handler.update_live_display(
+            test_rows,
+            "Test 1",
+            test_result,
+            status_code,
+            code,
+            live_display=live_mock,
+            display_label="Test Tool",
+        )
+
+    console = Console(file=io.StringIO(), width=120)
+    console.print(live_mock.update.call_args[0][0])
+    output = console.file.getvalue()
+
+    assert "Response 1" in output
+    assert "✅" in output
+    assert "waiting..." not in output
+
+
+def test_update_live_display_truncates_long_responses(mocker):
+    """Test update_live_display caps the response shown in the live table."""
+    handler = RunHandler()
+    mocker.patch.object(handler, "display_test_results", return_value="Test Table")
+    test_rows = []
+
+    handler.update_live_display(
+        test_rows,
+        "Test 1",
+        {"response": {"unexpected": "x" * 1000}},
+        200,
+        "TEST_CASE_COMPLETED",
+        live_display=mocker.MagicMock(),
+        display_label="Test Tool",
+    )
+
+    response_display = test_rows[0]["response_display"]
+    assert len(response_display) == LIVE_RESPONSE_MAX_LENGTH
+    assert response_display.startswith("{'unexpected': 'xxx")
+    assert response_display.endswith("…")
+
+
+def test_update_live_display_skips_render_when_row_is_unchanged(mocker):
+    """Test update_live_display does not redraw when an event does not change what the row shows."""
+    handler = RunHandler()
+    live_mock = mocker.MagicMock()
+    display_mock = mocker.patch.object(handler, "display_test_results", return_value="Test Table")
+
+    test_rows = [
+        {
+            "name": "Test 1",
+            "status": None,
+            "response": None,
+            "code": "TEST_CASE_RUNNING",
+            "response_display": "waiting...",
+        }
+    ]
+    handler.update_live_display(
+        test_rows,
+        "Test 1",
+        None,
+        None,
+        "TEST_CASE_RUNNING",
+        live_display=live_mock,
+        display_label="Test Tool",
+    )
+
+    display_mock.assert_not_called()
+    live_mock.update.assert_not_called()
+    assert handler._changed_live_rows == set()
 
 
 def test_execute_with_none_test_definition(mocker, mock_store_values):
@@ -1614,3 +1985,34 @@ def test_cli_client_run_test_active_uses_resources_folder(mocker, mock_store_val
         assert captured["data"]["type"] == "active"
         assert captured["data"]["agent_key"] == "agent_a"
         assert "tool_key" not in captured["data"]
+
+
+def test_build_tool_index():
+    """Test build_tool_index maps every tool of every agent by agent and tool key."""
+    definition = {
+        "agents": {
+            "get_address": {
+                "tools": [
+                    {"get_address": {"source": {"path": "tools/get_address"}}},
+                    {"get_weather": {"source": {"path": "tools/get_weather"}}},
+                ]
+            },
+            "no_tools": {},
+        }
+    }
+
+    tool_index = build_tool_index(definition)
+
+    assert list(tool_index["get_address"]) == ["get_address", "get_weather"]
+    assert tool_index["get_address"]["get_weather"] == {"source": {"path": "tools/get_weather"}}
+    assert tool_index["no_tools"] == {}
+
+
+def test_load_default_test_definition_propagates_unexpected_errors(mocker):
+    """Test load_default_test_definition only swallows errors caused by malformed tool data."""
+    handler = RunHandler()
+    tool_index = mocker.MagicMock()
+    tool_index.get.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        handler.load_default_test_definition(tool_index, "get_address", "get_address")
@@ -1,6 +1,7 @@
 import json
 import os
 import pytest
+import rich_click as click
 
 from weni_cli.store import Store, STORE_TOKEN_KEY
 
@@ -105,6 +106,27 @@ class TestStore:
         # Verify default value is returned
         assert result == default_value
 
+    def test_get_reads_the_file_once(self, temp_store_file, mocker):
+        # Create file with test data
+        with open(temp_store_file, "w") as f:
+            f.write(json.dumps({STORE_TOKEN_KEY: "test-token", "project_uuid": "123"}))
+
+        with pytest.MonkeyPatch().context() as mp:
+            mp.setattr(Store, "file_path", temp_store_file)
+            store = Store()
+            open_file_spy = mocker.spy(click, "open_file")
+
+            assert store.get(STORE_TOKEN_KEY) == "test-token"
+            assert store.get("project_uuid") == "123"
+
+        # Verify the values came from the content parsed on init
+        open_file_spy.assert_not_called()
+
+    def test_get_returns_value_after_set(self, store_with_temp_file):
+        store_with_temp_file.set(STORE_TOKEN_KEY, "new-token")
+
+        assert store_with_temp_file.get(STORE_TOKEN_KEY) == "new-token"
+
     def test_set_new_key(self, temp_store_file):
         # Create file with initial data
         initial_data = {}
@@ -152,6 +174,29 @@ class TestStore:
             content = json.loads(f.read())
             assert content == {existing_key: new_value}
 
+    def test_set_replaces_the_file_atomically(self, temp_store_file, mocker):
+        # Create file with existing data
+        initial_data = {STORE_TOKEN_KEY: "old-token"}
+        with open(temp_store_file, "w") as f:
+            f.write(json.dumps(initial_data))
+
+        with pytest.MonkeyPatch().context() as mp:
+            mp.setattr(Store, "file_path", temp_store_file)
+            store = Store()
+            mocker.patch("weni_cli.store.os.replace", side_effect=OSError("disk full"))
+
+            with pytest.raises(OSError):
+                store.set(STORE_TOKEN_KEY, "new-token")
+
+        # Verify the store file was left untouched when the swap failed
+        with open(temp_store_file, "r") as f:
+            assert json.loads(f.read()) == initial_data
+
+    def test_set_does_not_leave_temp_file(self, store_with_temp_file, temp_store_file):
+        store_with_temp_file.set(STORE_TOKEN_KEY, "new-token")
+
+        assert os.listdir(os.path.dirname(temp_store_file)) == [os.path.basename(temp_store_file)]
+
     def test_file_path_uses_home_directory(self):
         # Create a real Store instance
         store = Store()
@@ -155,3 +155,7 @@ class ProjectPushHandler(Handler):
             click.echo("Definition pushed successfully")
             if apm_instrumentation == "enabled":
                 formatter.print_warning_panel(APM_OBSERVABILITY_WARNING, title="APM instrumentation enabled")
+        finally:
+            # requests reads the zips into the multipart body, the handles are no longer needed
+            for resource_file in resources_folder_map.values():
+                resource_file.close()
@@ -1,14 +1,13 @@
+import contextlib
+import functools
 import os
-from io import BufferedReader
+import re
+import sys
+from io import BytesIO
 from typing import Optional
 
 import rich_click as click
-from rich.console import Console, group
-from rich.live import Live
-from rich.panel import Panel
-from rich.table import Table
 
-from weni_cli.clients.cli_client import CLIClient
 from weni_cli.formatter.formatter import Formatter
 from weni_cli.handler import Handler
 from weni_cli.packager.loader import load_active_agent_resources
@@ -25,6 +24,9 @@ from weni_cli.validators.agent_definition import (
 
 DEFAULT_TEST_DEFINITION_FILE = "test_definition.yaml"
 
+# How many times per second Live repaints the results table from its refresh thread
+LIVE_REFRESH_PER_SECOND = 4
+
 PASSIVE_TYPE = "passive"
 ACTIVE_TYPE = "active"
 
@@ -50,6 +52,23 @@ ACTIVE_STATUS_NAMES = {
     6: "GLOBAL_RULE_NOT_MATCHED",
 }
 
+# Passive runs only report the HTTP status code of the tool response
+PASSIVE_STATUS_ICONS = {200: "✅"}
+FAILED_STATUS_ICON = "❌"
+RUNNING_STATUS_ICON = "⏳"
+
+# The response column does not wrap, anything past a wide terminal is cropped anyway. Cutting long
+# responses up front keeps Rich from measuring huge strings on every refresh.
+LIVE_RESPONSE_MAX_LENGTH = 300
+
+# One ``KEY=value`` entry of a tool .env/.globals file. A value wrapped in a matching pair of single or double
+# quotes is unquoted, anything else is kept as written. Lines that do not match, like comments and blank lines,
+# are skipped.
+KEY_VALUE_LINE_PATTERN = re.compile(
+    r"^[ \t]*(?P<key>[A-Za-z_]\w*)[ \t]*=[ \t]*(?:(?P<quote>[\"'])(?P<quoted>.*?)(?P=quote)|(?P<value>.*?))[ \t\r]*$",
+    re.MULTILINE,
+)
+
 
 def detect_agent_type(definition_data: dict) -> str:
     """Detect whether the loaded definition describes a passive (Tool) or active agent."""
@@ -63,7 +82,48 @@ def detect_agent_type(definition_data: dict) -> str:
     return PASSIVE_TYPE
 
 
+def build_tool_index(definition_data: dict) -> dict[str, dict[str, dict]]:
+    """Index the tools of every agent as ``{agent_key: {tool_key: tool_data}}``.
+
+    Tools are declared as a list of single-key dicts, so the definition is walked once here
+    and every later lookup is a plain dict access.
+    """
+    tool_index: dict[str, dict[str, dict]] = {}
+    for agent_key, agent_data in definition_data.get("agents", {}).items():
+        agent_tools = tool_index[agent_key] = {}
+        for tool in agent_data.get("tools", []):
+            if isinstance(tool, dict):
+                for tool_key, tool_data in tool.items():
+                    agent_tools.setdefault(tool_key, tool_data)
+
+    return tool_index
+
+
+def _parse_key_value_file(file_path: str) -> dict:
+    try:
+        with open(file_path, "rb") as file:
+            # a stray non UTF-8 byte should not make the whole file unreadable
+            data = file.read().decode("utf-8", "replace")
+    except OSError:
+        # a missing or unreadable file (permissions, a folder with that name) just means no entries
+        return {}
+
+    return {
+        match["key"]: match["quoted"] if match["quote"] else match["value"]
+        for match in KEY_VALUE_LINE_PATTERN.finditer(data)
+    }
+
+
 class RunHandler(Handler):
+    def __init__(self):
+        self._reset_live_state()
+
+    def _reset_live_state(self):
+        # the live table is built once per run and then only the rows that changed are written into it
+        self._live_table = None
+        self._live_row_index: dict[str, int] = {}
+        self._changed_live_rows: set[int] = set()
+
     def execute(self, **kwargs):
         definition_path = kwargs.get("definition")
         agent_key = kwargs.get("agent_key")
@@ -146,11 +206,10 @@ class RunHandler(Handler):
             )
             return
 
-        agent_tools = []
-        for tool in definition_data["agents"][agent_key].get("tools", []):
-            if isinstance(tool, dict):
-                agent_tools.extend(tool.keys())
+        tool_index = build_tool_index(definition_data)
+        agent_tools = tool_index[agent_key]
 
+        # dict membership, the list of available tools is only joined when reporting the error
         if tool_key not in agent_tools:
             formatter.print_error_panel(
                 f"Tool '{tool_key}' not found in agent '{agent_key}'.\nAvailable tools: {', '.join(agent_tools)}",
@@ -159,7 +218,7 @@ class RunHandler(Handler):
             return
 
         if not test_definition_path:
-            test_definition_path = self.load_default_test_definition(definition_data, agent_key, tool_key)
+            test_definition_path = self.load_default_test_definition(tool_index, agent_key, tool_key)
 
             if not test_definition_path:
                 click.echo(
@@ -168,7 +227,7 @@ class RunHandler(Handler):
                 click.echo("You can use the --file option to specify a different file.")
                 return
 
-        tool_folder, error = self.load_tool_folder(definition_data, agent_key, tool_key)
+        tool_folder, error = self.load_tool_folder(tool_index, agent_key, tool_key)
         if error:
             formatter.print_error_panel(error)
             return
@@ -180,7 +239,7 @@ class RunHandler(Handler):
 
         definition = format_definition(definition_data)
 
-        tool_source_path = self.get_tool_source_path(definition, agent_key, tool_key)
+        tool_source_path = self.get_tool_source_path(tool_index, agent_key, tool_key)
 
         credentials = self.load_tool_credentials(tool_source_path)
 
@@ -260,70 +319,47 @@ class RunHandler(Handler):
         )
 
     def parse_agent_tool(self, agent_tool) -> tuple[Optional[str], Optional[str]]:
-        try:
-            return agent_tool.split(".")[0], agent_tool.split(".")[1]
-        except Exception:
+        agent, separator, rest = agent_tool.partition(".")
+        tool = rest.partition(".")[0]
+        if not separator or not tool:
             return None, None
 
-    def get_tool_source_path(self, definition, agent_key, tool_key) -> Optional[str]:
-        agent_data = definition.get("agents", {}).get(agent_key)
+        return agent, tool
 
-        if not agent_data:
+    def get_tool_source_path(self, tool_index, agent_key, tool_key) -> Optional[str]:
+        tool_data = tool_index.get(agent_key, {}).get(tool_key)
+
+        if not tool_data:
             return None
 
-        for tool in agent_data.get("tools", []):
-            if tool.get("key") == tool_key:
-                return tool.get("source", {}).get("path")
-        return None
+        return (tool_data.get("source") or {}).get("path")
 
     def load_tool_credentials(self, tool_source_path: str) -> Optional[dict]:
-        credentials = {}
-        try:
-            with open(f"{tool_source_path}/.env", "r") as file:
-                for line in file:
-                    key, value = line.strip().split("=")
-                    credentials[key] = value
-        except Exception:
-            return {}
-
-        return credentials
+        return _parse_key_value_file(os.path.join(tool_source_path, ".env"))
 
     def load_tool_globals(self, tool_source_path: str) -> Optional[dict]:
-        globals = {}
-        try:
-            with open(f"{tool_source_path}/.globals", "r") as file:
-                for line in file:
-                    key, value = line.strip().split("=")
-                    globals[key] = value
-        except Exception:
-            return {}
-
-        return globals
+        return _parse_key_value_file(os.path.join(tool_source_path, ".globals"))
 
-    def load_default_test_definition(self, definition, agent_key, tool_key) -> Optional[str]:
+    def load_default_test_definition(self, tool_index, agent_key, tool_key) -> Optional[str]:
         try:
-            definition_path = None
+            tool_data = tool_index.get(agent_key, {}).get(tool_key)
 
-            agent_data = definition.get("agents", {}).get(agent_key)
-
-            if not agent_data:
+            if not tool_data:
                 return None
 
-            for tool in agent_data.get("tools", []):
-                for key, tool_data in tool.items():
-                    if key == tool_key:
-                        path_test = tool_data.get("source", {}).get("path_test")
-                        tool_path = tool_data.get("source", {}).get("path")
-                        if tool_data.get("source", {}).get("path_test"):
-                            definition_path = f"{tool_path}/{path_test}"
-                        else:
-                            definition_path = f"{tool_path}/{DEFAULT_TEST_DEFINITION_FILE}"
-
-            if not definition_path:
+            source = tool_data.get("source") or {}
+            path_test = source.get("path_test")
+            tool_path = source.get("path")
+            # without a source folder there is nowhere to look for the default test definition
+            if not tool_path:
                 return None
 
-            return definition_path
-        except Exception as e:
+            if path_test:
+                return f"{tool_path}/{path_test}"
+
+            return f"{tool_path}/{DEFAULT_TEST_DEFINITION_FILE}"
+        except (AttributeError, TypeError) as e:
+            # malformed tool entries, e.g. a ``source`` that is not a mapping
             click.echo(f"Error: Failed to load default test definition file: {e}")
             return None
 
@@ -333,26 +369,18 @@ class RunHandler(Handler):
             base_dir = os.path.dirname(os.path.abspath(definition_path))
             candidate = os.path.join(base_dir, DEFAULT_TEST_DEFINITION_FILE)
             return candidate if os.path.exists(candidate) else None
-        except Exception as e:
+        except (TypeError, ValueError) as e:
             click.echo(f"Error: Failed to load default test definition file: {e}")
             return None
 
     def load_tool_folder(
-        self, definition, agent_key, tool_key
-    ) -> tuple[Optional[BufferedReader], Optional[Exception]]:
-        agent_data = definition.get("agents", {}).get(agent_key)
-        if not agent_data:
+        self, tool_index, agent_key, tool_key
+    ) -> tuple[Optional[BytesIO], Optional[Exception]]:
+        agent_tools = tool_index.get(agent_key)
+        if agent_tools is None:
             return None, Exception(f"Agent {agent_key} not found in definition")
 
-        tools = agent_data.get("tools", [])
-
-        tool_data = None
-        for tool in tools:
-            for key, data in tool.items():
-                if key == tool_key:
-                    tool_data = data
-                    break
-
+        tool_data = agent_tools.get(tool_key)
         if not tool_data:
             return None, Exception(f"Tool {tool_key} not found in agent {agent_key}")
 
@@ -373,6 +401,12 @@ class RunHandler(Handler):
         return self._format_passive_response_for_display(test_result)
 
     def _format_passive_response_for_display(self, test_result):
+        # fast path for the common, complete response shape, partial responses fall through to the stepwise lookup
+        try:
+            return test_result["response"]["functionResponse"]["responseBody"]["TEXT"]["body"]
+        except (KeyError, TypeError):
+            pass
+
         if isinstance(test_result, dict) and "response" in test_result:
             response = test_result.get("response")
 
@@ -421,16 +455,15 @@ class RunHandler(Handler):
             if response_status in ACTIVE_STATUS_ICONS:
                 return ACTIVE_STATUS_ICONS[response_status]
 
-        if status_code == 200:
-            return "✅"
-
-        return "❌"
+        return PASSIVE_STATUS_ICONS.get(status_code, FAILED_STATUS_ICON)
 
     def display_test_results(self, rows, display_label, agent_type: str = PASSIVE_TYPE, verbose: bool = False):
         """Build the Rich table used by the live display."""
         if not rows:
             return None
 
+        from rich.table import Table
+
         title = (
             f"Test Results for {display_label} (active agent)"
             if agent_type == ACTIVE_TYPE
@@ -445,17 +478,31 @@ class RunHandler(Handler):
             table.add_column("Response", ratio=2, no_wrap=True)
 
         for row in rows:
-            if row.get("code") == "TEST_CASE_COMPLETED":
-                status = self.get_status_icon(
-                    row.get("status"), agent_type=agent_type, response=row.get("response")
-                )
-            else:
-                status = "⏳"
-            response_display = self.format_response_for_display(row.get("response"), agent_type=agent_type)
-            table.add_row(row.get("name"), status, response_display)
+            table.add_row(*self._build_result_cells(row, agent_type=agent_type))
 
         return table
 
+    def _build_result_cells(self, row, agent_type: str = PASSIVE_TYPE) -> tuple:
+        # Text cells are rendered as-is, plain strings would go through Rich's markup and emoji parsing on every
+        # redraw and brackets in a tool response could be taken for markup
+        from rich.text import Text
+
+        if row.get("code") == "TEST_CASE_COMPLETED":
+            status = self.get_status_icon(row.get("status"), agent_type=agent_type, response=row.get("response"))
+        else:
+            status = RUNNING_STATUS_ICON
+
+        response_display = row.get("response_display")
+        if response_display is None:
+            response_display = self.format_response_for_display(row.get("response"), agent_type=agent_type)
+
+        name = row.get("name")
+        return (
+            Text("" if name is None else str(name)),
+            Text(status),
+            Text("" if response_display is None else str(response_display)),
+        )
+
     def update_live_display(  # noqa: PLR0913
         self,
         test_rows,
@@ -463,53 +510,135 @@ class RunHandler(Handler):
         test_result,
         status_code,
         code,
+        verbose: bool = False,
+        *,
         live_display,
         display_label,
         agent_type: str = PASSIVE_TYPE,
-        verbose: bool = False,
     ):
-        row_index = next((i for i, row in enumerate(test_rows) if row.get("name") == test_name), None)
+        # format the response once per event instead of on every table rebuild
+        response_display = self.format_response_for_display(test_result, agent_type=agent_type)
+        if isinstance(response_display, str) and len(response_display) > LIVE_RESPONSE_MAX_LENGTH:
+            response_display = response_display[: LIVE_RESPONSE_MAX_LENGTH - 1] + "…"
+
+        # the index is kept in sync as rows are appended, it is only rebuilt when test_rows was filled elsewhere
+        if len(self._live_row_index) != len(test_rows):
+            self._live_row_index = {row.get("name"): i for i, row in enumerate(test_rows)}
+
+        row_index = self._live_row_index.get(test_name)
         if row_index is None:
-            test_rows.append({"name": test_name, "status": status_code, "response": test_result, "code": code})
+            self._live_row_index[test_name] = len(test_rows)
+            self._changed_live_rows.add(len(test_rows))
+            test_rows.append(
+                {
+                    "name": test_name,
+                    "status": status_code,
+                    "response": test_result,
+                    "code": code,
+                    "response_display": response_display,
+                }
+            )
         else:
+            row = test_rows[row_index]
+            if (row.get("status"), row.get("code"), row.get("response_display")) == (
+                status_code,
+                code,
+                response_display,
+            ):
+                # nothing shown in the table changed, there is nothing to redraw
+                row["response"] = test_result
+                return
+
+            self._changed_live_rows.add(row_index)
             test_rows[row_index]["status"] = status_code
             test_rows[row_index]["response"] = test_result
             test_rows[row_index]["code"] = code
+            test_rows[row_index]["response_display"] = response_display
 
-        live_display.update(
-            self.display_test_results(test_rows, display_label, agent_type=agent_type, verbose=verbose),
-            refresh=True,
-        )
+        self._render_live_display(test_rows, live_display, display_label, agent_type=agent_type, verbose=verbose)
+
+    def _render_live_display(self, test_rows, live_display, display_label, agent_type=PASSIVE_TYPE, verbose=False):
+        if self._live_table is None:
+            self._live_table = self.display_test_results(
+                test_rows, display_label, agent_type=agent_type, verbose=verbose
+            )
+        else:
+            # Live's refresh thread renders this same table while holding its lock, so the table is only changed
+            # under that lock, otherwise a repaint in the middle of add_row sees more cells than rows
+            with live_display._lock:
+                # rows are only ever appended, so a changed index past the table end is a new row
+                for row_index in sorted(self._changed_live_rows):
+                    cells = self._build_result_cells(test_rows[row_index], agent_type=agent_type)
+                    if row_index < self._live_table.row_count:
+                        for column, cell in zip(self._live_table.columns, cells):
+                            column._cells[row_index] = cell
+                    else:
+                        self._live_table.add_row(*cells)
+
+        self._changed_live_rows.clear()
+        live_display.update(self._live_table)
+
+    def print_test_event(  # noqa: PLR0913
+        self, test_name, test_result, status_code, code, verbose: bool = False, *, agent_type: str = PASSIVE_TYPE
+    ):
+        """Print one plain line per test event, used instead of the live table outside a terminal.
+
+        In verbose mode the line also carries the status code the icon was resolved from.
+        """
+        if code != "TEST_CASE_COMPLETED":
+            click.echo(f"{test_name}: {RUNNING_STATUS_ICON}")
+            return
+
+        status = self.get_status_icon(status_code, agent_type=agent_type, response=test_result)
+        if verbose:
+            status = f"{status} (status {status_code})"
+        click.echo(f"{test_name}: {status} {self.format_response_for_display(test_result, agent_type=agent_type)}")
+
+    def use_live_display(self) -> bool:
+        """Live repaints the table several times per second, which only pays off on an interactive terminal."""
+        return sys.stdout.isatty() and not os.environ.get("CI")
 
     def render_reponse_and_logs(self, logs, agent_type: str = PASSIVE_TYPE):
+        from rich.console import Console, Group, group
+        from rich.panel import Panel
+
         console = Console()
 
         @group()
-        def get_panels():
-            if log.get("test_response"):
+        def get_panels(test_response, test_logs):
+            if test_response:
                 yield Panel(
-                    self.format_response_for_display(log.get("test_response"), agent_type=agent_type),
+                    self.format_response_for_display(test_response, agent_type=agent_type),
                     title="[bold yellow]Response[/bold yellow]",
                     title_align="left",
                 )
 
-            if log.get("test_logs"):
+            if test_logs:
                 yield Panel(
-                    log.get("test_logs").strip("\n"),
+                    test_logs.strip("\n"),
                     title="[bold blue]Logs[/bold blue]",
                     title_align="left",
                 )
 
-        console.print("\n")
+        # render every panel in a single print so the console writes out once instead of once per test
+        panels = []
         for log in logs:
-            if log.get("test_response") or log.get("test_logs"):
-                console.print(
-                    Panel(
-                        get_panels(),
-                        title=f"[bold green]Test Results for {log.get('test_name')}[/bold green]",
-                        title_align="left",
-                    )
+            test_response = log.get("test_response")
+            test_logs = log.get("test_logs")
+            if not (test_response or test_logs):
+                continue
+
+            panels.append(
+                Panel(
+                    get_panels(test_response, test_logs),
+                    title=f"[bold green]Test Results for {log.get('test_name')}[/bold green]",
+                    title_align="left",
                 )
+            )
+
+        console.print("\n")
+        if panels:
+            console.print(Group(*panels))
 
     def run_test(  # noqa: PLR0913
         self,
@@ -528,24 +657,36 @@ class RunHandler(Handler):
     ):
         test_rows: list[dict] = []
         display_label = display_label or tool_key or agent_key
+        self._reset_live_state()
+
+        live_context: contextlib.AbstractContextManager
+        if self.use_live_display():
+            # Rich's live rendering stack is only needed once tests actually run, keep it off the import path
+            from rich.live import Live
+
+            live_context = Live(
+                self.display_test_results([], display_label, agent_type=agent_type, verbose=verbose),
+                refresh_per_second=LIVE_REFRESH_PER_SECOND,
+            )
+        else:
+            live_context = contextlib.nullcontext()
 
-        with Live(
-            self.display_test_results([], display_label, agent_type=agent_type, verbose=verbose),
-            refresh_per_second=4,
-        ) as live:
-            def update_live_callback(test_name, test_result, status_code, code, verbose):
-                self.update_live_display(
+        with live_context as live:
+            # the client calls back with (test_name, test_result, status_code, code, verbose)
+            if live is None:
+                update_callback = functools.partial(self.print_test_event, agent_type=agent_type)
+            else:
+                update_callback = functools.partial(
+                    self.update_live_display,
                     test_rows,
-                    test_name,
-                    test_result,
-                    status_code,
-                    code,
-                    live,
-                    display_label,
+                    live_display=live,
+                    display_label=display_label,
                     agent_type=agent_type,
-                    verbose=verbose,
                 )
 
+            # the HTTP client pulls in requests, only import it once the tests are about to run
+            from weni_cli.clients.cli_client import CLIClient
+
             client = CLIClient()
             test_logs = client.run_test(
                 project_uuid,
@@ -557,7 +698,7 @@ class RunHandler(Handler):
                 credentials,
                 tool_globals,
                 agent_type,
-                update_live_callback,
+                update_callback,
                 verbose,
                 resources_folder=resources_folder,
             )
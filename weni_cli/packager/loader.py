@@ -5,73 +5,106 @@ to zip the same kinds of resources (tools, rules, preprocessor) before
 uploading them to the backend.
 """
 
-from io import BufferedReader
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 import os
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from weni_cli.packager.packager import create_agent_resource_folder_zip
 
 PREPROCESSOR_RESOURCE_KEY = "preprocessor_folder"
 PREPROCESSOR_OUTPUT_EXAMPLE_KEY = "preprocessor_example"
 
+# zlib releases the GIL while deflating, so resource folders can be zipped concurrently
+MAX_ZIP_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _zip_resource_folders(
+    resources: list[tuple[str, str]],
+) -> list[tuple[Optional[BytesIO], Optional[Exception]]]:
+    """Zip every ``(resource_key, resource_path)`` pair, returning the results in the same order."""
+    if len(resources) <= 1 or MAX_ZIP_WORKERS <= 1:
+        return [create_agent_resource_folder_zip(key, path) for key, path in resources]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_ZIP_WORKERS, len(resources))) as executor:
+        return list(executor.map(lambda resource: create_agent_resource_folder_zip(*resource), resources))
+
+
+def _close_resource_files(results: list[tuple[Optional[BytesIO], Optional[Exception]]]) -> None:
+    for resource_file, _ in results:
+        if resource_file:
+            resource_file.close()
+
 
 def load_tools_folders(
     definition: dict,
-) -> tuple[Optional[dict[str, BufferedReader]], Optional[str]]:
+) -> tuple[Optional[dict[str, BinaryIO]], Optional[str]]:
     """Build a ``{agent_key:tool_key: zip_file}`` map for every tool in the definition."""
-    tools_folder_map: dict[str, BufferedReader] = {}
+    tools_folder_map: dict[str, BinaryIO] = {}
 
     agents = definition.get("agents", {})
 
+    tools_entries = []
     for agent_key, agent_data in agents.items():
         tools = agent_data.get("tools", {})
         for tool in tools:
             for tool_key, tool_data in tool.items():
-                tool_folder, error = create_agent_resource_folder_zip(
-                    tool_key, tool_data.get("source").get("path")
-                )
-                if error or not tool_folder:
-                    return (
-                        None,
-                        f"Failed to create tool folder for tool {tool_data.get('name')} "
-                        f"in agent {agent_data.get('name')}\n{error}",
-                    )
+                tools_entries.append((agent_key, agent_data, tool_key, tool_data))
+
+    results = _zip_resource_folders(
+        [(tool_key, tool_data.get("source").get("path")) for _, _, tool_key, tool_data in tools_entries]
+    )
+
+    for (agent_key, agent_data, tool_key, tool_data), (tool_folder, error) in zip(tools_entries, results):
+        if error or not tool_folder:
+            _close_resource_files(results)
+            return (
+                None,
+                f"Failed to create tool folder for tool {tool_data.get('name')} "
+                f"in agent {agent_data.get('name')}\n{error}",
+            )
 
-                tools_folder_map[f"{agent_key}:{tool_key}"] = tool_folder
+        tools_folder_map[f"{agent_key}:{tool_key}"] = tool_folder
 
     return tools_folder_map, None
 
 
 def load_rules_folders(
     definition: dict,
-) -> tuple[Optional[dict[str, BufferedReader]], Optional[str]]:
+) -> tuple[Optional[dict[str, BinaryIO]], Optional[str]]:
     """Build a ``{agent_key:rule_key: zip_file}`` map for every rule in the definition."""
-    rules_folder_map: dict[str, BufferedReader] = {}
+    rules_folder_map: dict[str, BinaryIO] = {}
 
     agents = definition.get("agents", {})
-    for agent_key, agent_data in agents.items():
-        rules = agent_data.get("rules", {})
-        for rule_key, rule_data in rules.items():
-            rule_folder, error = create_agent_resource_folder_zip(
-                rule_key, rule_data.get("source").get("path")
+    rules_entries = [
+        (agent_key, agent_data, rule_key, rule_data)
+        for agent_key, agent_data in agents.items()
+        for rule_key, rule_data in agent_data.get("rules", {}).items()
+    ]
+
+    results = _zip_resource_folders(
+        [(rule_key, rule_data.get("source").get("path")) for _, _, rule_key, rule_data in rules_entries]
+    )
+
+    for (agent_key, agent_data, rule_key, rule_data), (rule_folder, error) in zip(rules_entries, results):
+        if error or not rule_folder:
+            _close_resource_files(results)
+            return (
+                None,
+                f"Failed to create rule folder for rule {rule_data.get('name')} "
+                f"in agent {agent_data.get('name')}\n{error}",
             )
-            if error or not rule_folder:
-                return (
-                    None,
-                    f"Failed to create rule folder for rule {rule_data.get('name')} "
-                    f"in agent {agent_data.get('name')}\n{error}",
-                )
 
-            rules_folder_map[f"{agent_key}:{rule_key}"] = rule_folder
+        rules_folder_map[f"{agent_key}:{rule_key}"] = rule_folder
 
     return rules_folder_map, None
 
 
 def load_preprocessing_folder(
     definition: dict,
-) -> tuple[Optional[dict[str, BufferedReader]], Optional[str]]:
+) -> tuple[Optional[dict[str, BinaryIO]], Optional[str]]:
     """Build a ``{agent_key:preprocessor_folder: zip_file}`` (and optional example) map."""
-    preprocessing_folder_map: dict[str, BufferedReader] = {}
+    preprocessing_folder_map: dict[str, BinaryIO] = {}
 
     agents = definition.get("agents", {})
     for agent_key, agent_data in agents.items():
@@ -91,8 +124,8 @@ def load_preprocessing_folder(
 
         result_examples_file = preprocessing_data.get("result_examples_file")
         if result_examples_file:
-            preprocessing_example_path = (
-                f"{preprocessing_data.get('source').get('path')}{os.sep}{result_examples_file}"
+            preprocessing_example_path = os.path.join(
+                preprocessing_data.get("source").get("path"), result_examples_file
             )
             try:
                 preprocessor_example_file = open(preprocessing_example_path, "rb")
@@ -114,7 +147,7 @@ def load_preprocessing_folder(
 def load_active_agent_resources(
     definition: dict,
     agent_key: Optional[str] = None,
-) -> tuple[Optional[dict[str, BufferedReader]], Optional[str]]:
+) -> tuple[Optional[dict[str, BinaryIO]], Optional[str]]:
     """Load preprocessor + rules for either every active agent or a specific one.
 
     Returns a single combined map ready for the multipart payload of ``runs`` /
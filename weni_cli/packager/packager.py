@@ -1,38 +1,82 @@
-from io import BufferedReader
+from io import BytesIO
 import os
-from typing import Optional
+import shutil
+from typing import Iterator, Optional, Union
 
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
+# Level 1 keeps most of the size reduction of the default level (6) at several
+# times the throughput, which matters since the archive is uploaded right away.
+ZIP_COMPRESSION = ZIP_DEFLATED
+ZIP_COMPRESSLEVEL = 1
 
-def create_agent_resource_folder_zip(
-    resource_key, resource_path
-) -> tuple[Optional[BufferedReader], Optional[Exception]]:
+# Files in these formats are already compressed, deflating them again only burns CPU
+ALREADY_COMPRESSED_EXTENSIONS = (".zip", ".whl", ".gz", ".tgz", ".bz2", ".xz", ".png", ".jpg", ".jpeg", ".gif")
+
+# Entries get a fixed timestamp and permissions so unchanged folders produce byte-identical archives,
+# the timestamp is ZipInfo's default, which entries opened by name get as well
+ZIP_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_ENTRY_ATTRIBUTES = 0o644 << 16
+
+# Folders that are pruned from the walk, their contents are never statted
+SKIPPED_FOLDER_NAMES = frozenset({"__pycache__"})
+
+
+def create_agent_resource_folder_zip(resource_key, resource_path) -> tuple[Optional[BytesIO], Optional[Exception]]:
     zip_file_name = f"{resource_key}.zip"
-    zip_file_path = f"{resource_path}{os.sep}{zip_file_name}"
 
     if not os.path.exists(resource_path):
         return None, Exception(f"Folder {resource_path} not found")
 
-    # delete the existing zip file if it exists
-    if os.path.exists(zip_file_path):
-        os.remove(zip_file_path)
+    # the archive is only an upload payload, building it in memory avoids writing it into the
+    # resource folder and reading it back
+    zip_buffer = BytesIO()
+    # requests takes the multipart filename from the file object name
+    zip_buffer.name = zip_file_name
 
     try:
-        with ZipFile(zip_file_path, "w") as z:
-            for root, _, files in os.walk(resource_path):
-                # skip the newly created zip file to avoid adding it to itself
-                if zip_file_name in files:
-                    files.remove(zip_file_name)
+        with ZipFile(zip_buffer, "w", compression=ZIP_COMPRESSION, compresslevel=ZIP_COMPRESSLEVEL) as z:
+            # scandir order depends on the filesystem, sorting keeps the archive identical across machines
+            entries = sorted(_iter_zip_entries(resource_path, zip_file_name), key=lambda entry: entry[1])
+            for file_path, arcname in entries:
+                with open(file_path, "rb") as source, z.open(_zip_entry(arcname), "w") as destination:
+                    shutil.copyfileobj(source, destination)
+                # permissions are only kept in the central directory, which is written when the archive is closed
+                z.getinfo(arcname).external_attr = ZIP_ENTRY_ATTRIBUTES
 
-                # skip __pycache__ folders
-                if "__pycache__" in root:
-                    continue
-
-                # add the remaining files to the zip file
-                for file in files:
-                    z.write(os.path.join(root, file), os.path.relpath(os.path.join(root, file), resource_path))
-
-        return open(zip_file_path, "rb"), None
+        zip_buffer.seek(0)
+        return zip_buffer, None
     except Exception as error:
         return None, Exception(f"Failed to create resource zip file for resource path {resource_path}: {error}")
+
+
+def _zip_entry(arcname: str) -> Union[str, ZipInfo]:
+    """Return what ``ZipFile.open`` writes ``arcname`` as.
+
+    An entry opened by name takes the archive's compression and compression level and ZipInfo's default 1980
+    timestamp, so nothing is read from the file itself. Already-compressed files are stored as they are, a stored
+    entry has no level to carry over, so it is described by a ZipInfo with the same pinned timestamp.
+    """
+    if not arcname.lower().endswith(ALREADY_COMPRESSED_EXTENSIONS):
+        return arcname
+
+    zip_info = ZipInfo(arcname, date_time=ZIP_ENTRY_DATE_TIME)
+    zip_info.compress_type = ZIP_STORED
+    return zip_info
+
+
+def _iter_zip_entries(folder_path, zip_file_name, arc_prefix="") -> Iterator[tuple[str, str]]:
+    """Yield ``(file_path, arcname)`` for every file that belongs in the resource zip, in a single scandir pass.
+
+    Archive names are built from the parent folder's prefix as the walk descends, so no per-file
+    ``os.path.relpath`` is needed. Folders in ``SKIPPED_FOLDER_NAMES`` are matched by their exact name and never
+    descended into, and a ``<resource_key>.zip`` left in the folder root by older CLI versions, which wrote the
+    archive there, is skipped.
+    """
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIPPED_FOLDER_NAMES:
+                    yield from _iter_zip_entries(entry.path, zip_file_name, f"{arc_prefix}{entry.name}/")
+            elif entry.is_file() and (arc_prefix or entry.name != zip_file_name):
+                yield entry.path, f"{arc_prefix}{entry.name}"
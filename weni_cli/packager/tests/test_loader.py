@@ -2,6 +2,7 @@
 
 import io
 import os
+from zipfile import ZipFile
 
 import pytest
 from click.testing import CliRunner
@@ -83,6 +84,51 @@ class TestLoadToolsFolders:
         assert "Failed to create tool folder" in error
         assert "boom" in error
 
+    def test_zips_every_tool_folder(self):
+        definition = {
+            "agents": {
+                "agent_a": {
+                    "name": "Agent A",
+                    "tools": [
+                        {f"tool_{index}": {"name": f"Tool {index}", "source": {"path": f"tools/tool_{index}"}}}
+                        for index in range(4)
+                    ],
+                }
+            }
+        }
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            for index in range(4):
+                os.makedirs(f"tools/tool_{index}")
+                with open(f"tools/tool_{index}/main.py", "w") as f:
+                    f.write(f"# tool {index}")
+
+            result, error = loader.load_tools_folders(definition)
+
+            assert error is None
+            assert list(result) == [f"agent_a:tool_{index}" for index in range(4)]
+            for index in range(4):
+                with ZipFile(result[f"agent_a:tool_{index}"]) as z:
+                    assert z.read("main.py") == f"# tool {index}".encode()
+
+    def test_closes_created_zips_when_another_tool_fails(self, mocker, passive_definition):
+        passive_definition["agents"]["agent_a"]["tools"].append(
+            {"tool_b": {"name": "Tool B", "source": {"path": "tools/tool_b"}}}
+        )
+        created_zip = _fake_zip(b"tool")
+        mocker.patch.object(
+            loader,
+            "create_agent_resource_folder_zip",
+            side_effect=lambda key, path: (created_zip, None) if key == "tool_a" else (None, Exception("boom")),
+        )
+
+        result, error = loader.load_tools_folders(passive_definition)
+
+        assert result is None
+        assert "Tool B" in error
+        assert created_zip.closed
+
 
 class TestLoadRulesFolders:
     def test_returns_zip_for_each_rule(self, mocker, active_definition):
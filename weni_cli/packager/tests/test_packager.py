@@ -1,7 +1,9 @@
 import os
 import pytest
-from zipfile import ZipFile
+import zlib
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 from click.testing import CliRunner
+from weni_cli.packager import packager
 from weni_cli.packager.packager import create_agent_resource_folder_zip
 
 
@@ -54,15 +56,12 @@ def test_create_tool_folder_zip_success(tool_setup, mocker):
     # Verify the error is None
     assert error is None
 
-    # Close the file handle
-    result.close()
-
-    # Verify the zip file was created
-    zip_path = f"{tool_path}/{tool_name}.zip"
-    assert os.path.exists(zip_path)
+    # Verify the archive is built in memory and keeps the zip name used for the upload
+    assert result.name == f"{tool_name}.zip"
+    assert not os.path.exists(f"{tool_path}/{tool_name}.zip")
 
     # Verify the contents of the zip file
-    with ZipFile(zip_path, "r") as z:
+    with ZipFile(result, "r") as z:
         file_list = z.namelist()
 
         # Check expected files are included
@@ -88,8 +87,8 @@ def test_create_tool_folder_zip_nonexistent_path(mocker):
     assert "Folder nonexistent_path not found" in str(error)
 
 
-def test_create_tool_folder_zip_overwrites_existing(tool_setup):
-    """Test that the function overwrites existing zip files."""
+def test_create_tool_folder_zip_ignores_stale_zip_file(tool_setup):
+    """Test that a zip left in the folder by older versions is neither packaged nor touched."""
     tool_name, tool_path = tool_setup
     zip_path = f"{tool_path}/{tool_name}.zip"
 
@@ -97,31 +96,23 @@ def test_create_tool_folder_zip_overwrites_existing(tool_setup):
     with ZipFile(zip_path, "w") as z:
         z.writestr("dummy.txt", "This is a dummy file")
 
-    # Get the initial modification time
-    initial_mtime = os.path.getmtime(zip_path)
-
-    # Wait a moment to ensure mtime would be different
-    import time
-
-    time.sleep(0.1)
-
-    # Call the function which should overwrite the existing zip
     result, error = create_agent_resource_folder_zip(tool_name, tool_path)
     assert result is not None
-    result.close()
 
     # Verify the error is None
     assert error is None
 
-    # Verify the file was modified
-    assert os.path.getmtime(zip_path) > initial_mtime
-
-    # Verify the contents changed (dummy.txt should no longer be there)
-    with ZipFile(zip_path, "r") as z:
+    # Verify the stale zip is not part of the archive
+    with ZipFile(result, "r") as z:
         file_list = z.namelist()
+        assert f"{tool_name}.zip" not in file_list
         assert "dummy.txt" not in file_list
         assert "tool.py" in file_list
 
+    # Verify the stale zip was left as it was
+    with ZipFile(zip_path, "r") as z:
+        assert z.namelist() == ["dummy.txt"]
+
 
 def test_create_tool_folder_zip_exception_handling(tool_setup, mocker):
     """Test handling of exceptions during zip creation."""
@@ -147,8 +138,8 @@ def test_create_tool_folder_zip_skips_zip_file(tool_setup, mocker):
     """Test that the zip file itself is not included in the zip."""
     tool_name, tool_path = tool_setup
 
-    # Create a spy on the ZipFile.write method to see what files are added
-    spy_write = mocker.spy(ZipFile, "write")
+    # Create a spy on ZipFile.open to see what entries are added
+    spy_open = mocker.spy(ZipFile, "open")
 
     # Call the function
     result, error = create_agent_resource_folder_zip(tool_name, tool_path)
@@ -159,9 +150,10 @@ def test_create_tool_folder_zip_skips_zip_file(tool_setup, mocker):
     assert error is None
 
     # Verify the zip file itself was not added to the zip
-    for call_args in spy_write.call_args_list:
-        filepath = call_args[0][1]  # The filepath argument
-        assert f"{tool_name}.zip" not in filepath
+    assert spy_open.call_count == 3
+    for call_args in spy_open.call_args_list:
+        entry = call_args[0][1]  # The entry name or ZipInfo argument
+        assert f"{tool_name}.zip" not in str(entry)
 
 
 def test_create_tool_folder_zip_with_empty_folder(mocker):
@@ -177,13 +169,12 @@ def test_create_tool_folder_zip_with_empty_folder(mocker):
 
         # Verify the result is not None
         assert result is not None
-        result.close()
 
         # Verify the error is None
         assert error is None
 
         # Verify an empty zip was created
-        with ZipFile(f"{tool_path}/empty-tool.zip", "r") as z:
+        with ZipFile(result, "r") as z:
             assert len(z.namelist()) == 0
 
 
@@ -208,16 +199,12 @@ def test_create_tool_folder_zip_with_relative_path(mocker):
 
             # Verify the result is not None
             assert result is not None
-            result.close()
 
             # Verify the error is None
             assert error is None
 
-            # Verify the zip file was created in the correct location
-            assert os.path.exists("tools/my_tool/my-tool.zip")
-
             # Verify the contents
-            with ZipFile("tools/my_tool/my-tool.zip", "r") as z:
+            with ZipFile(result, "r") as z:
                 assert "tool.py" in z.namelist()
         finally:
             # Change back to the original directory
@@ -249,13 +236,12 @@ def test_create_tool_folder_zip_with_nested_duplicate_filenames(mocker):
 
         # Verify the result is not None
         assert result is not None
-        result.close()
 
         # Verify the error is None
         assert error is None
 
         # Verify the zip contains all files with proper paths
-        with ZipFile(f"{tool_path}/tool-with-dupes.zip", "r") as z:
+        with ZipFile(result, "r") as z:
             file_list = z.namelist()
             assert "main.py" in file_list
             assert "dir1/config.py" in file_list
@@ -264,3 +250,133 @@ def test_create_tool_folder_zip_with_nested_duplicate_filenames(mocker):
             # Read the content to verify the correct files were included
             assert "# Config for dir1" == z.read("dir1/config.py").decode("utf-8")
             assert "# Config for dir2" == z.read("dir2/config.py").decode("utf-8")
+
+
+def test_create_tool_folder_zip_only_skips_exact_pycache_folders(mocker):
+    """Test that only folders named exactly __pycache__ are skipped."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        tool_path = "tool_folder"
+        os.makedirs(f"{tool_path}/not__pycache__", exist_ok=True)
+        os.makedirs(f"{tool_path}/nested/__pycache__", exist_ok=True)
+
+        with open(f"{tool_path}/not__pycache__/module.py", "w") as f:
+            f.write("# Should be kept")
+
+        with open(f"{tool_path}/nested/__pycache__/module.pyc", "w") as f:
+            f.write("# Should be skipped")
+
+        result, error = create_agent_resource_folder_zip("test-tool", tool_path)
+        assert error is None
+
+        with ZipFile(result, "r") as z:
+            file_list = z.namelist()
+            assert "not__pycache__/module.py" in file_list
+            assert "nested/__pycache__/module.pyc" not in file_list
+
+
+def test_create_tool_folder_zip_stores_already_compressed_files(mocker):
+    """Test that already compressed files are stored instead of deflated again."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        tool_path = "tool_folder"
+        os.makedirs(tool_path, exist_ok=True)
+
+        with open(f"{tool_path}/main.py", "w") as f:
+            f.write("def run(input, context):\n    return input")
+
+        with open(f"{tool_path}/logo.png", "wb") as f:
+            f.write(b"\x89PNG fake image")
+
+        result, error = create_agent_resource_folder_zip("test-tool", tool_path)
+        assert error is None
+
+        with ZipFile(result, "r") as z:
+            assert z.getinfo("main.py").compress_type == ZIP_DEFLATED
+            assert z.getinfo("logo.png").compress_type == ZIP_STORED
+
+
+def test_create_tool_folder_zip_is_reproducible(tool_setup):
+    """Test that zipping an unchanged folder twice produces identical archives with pinned timestamps."""
+    tool_name, tool_path = tool_setup
+
+    first, error = create_agent_resource_folder_zip(tool_name, tool_path)
+    assert error is None
+
+    os.utime(f"{tool_path}/tool.py", (0, 2_000_000_000))
+
+    second, error = create_agent_resource_folder_zip(tool_name, tool_path)
+    assert error is None
+
+    assert first.getvalue() == second.getvalue()
+    with ZipFile(second, "r") as z:
+        assert z.getinfo("tool.py").date_time == (1980, 1, 1, 0, 0, 0)
+
+
+def test_create_tool_folder_zip_accepts_files_older_than_1980(tool_setup):
+    """Test that files with a pre-1980 modification time are packaged with the pinned timestamp."""
+    tool_name, tool_path = tool_setup
+    os.utime(f"{tool_path}/tool.py", (0, 0))
+
+    result, error = create_agent_resource_folder_zip(tool_name, tool_path)
+    assert error is None
+
+    with ZipFile(result, "r") as z:
+        assert z.getinfo("tool.py").date_time == (1980, 1, 1, 0, 0, 0)
+        assert z.read("tool.py").startswith(b"def run(")
+
+
+def test_create_tool_folder_zip_streams_files_into_the_archive(tool_setup, mocker):
+    """Test that file contents are streamed into the archive instead of being read whole."""
+    tool_name, tool_path = tool_setup
+    copy_spy = mocker.spy(packager.shutil, "copyfileobj")
+    writestr_spy = mocker.spy(ZipFile, "writestr")
+
+    result, error = create_agent_resource_folder_zip(tool_name, tool_path)
+    assert error is None
+
+    assert copy_spy.call_count == 3
+    writestr_spy.assert_not_called()
+    with ZipFile(result, "r") as z:
+        assert z.getinfo("tool.py").compress_type == ZIP_DEFLATED
+
+
+def test_create_tool_folder_zip_writes_entries_sorted_by_name(mocker):
+    """Test that entries are written in archive name order, whatever order the filesystem lists them in."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        tool_path = "tool_folder"
+        os.makedirs(f"{tool_path}/a", exist_ok=True)
+        for name in ("b.py", "a/x.py", "a.txt"):
+            with open(f"{tool_path}/{name}", "w") as f:
+                f.write(name)
+
+        result, error = create_agent_resource_folder_zip("test-tool", tool_path)
+        assert error is None
+
+        with ZipFile(result, "r") as z:
+            assert z.namelist() == ["a.txt", "a/x.py", "b.py"]
+
+
+def test_create_tool_folder_zip_uses_the_archive_compression_level(tool_setup, mocker):
+    """Test that deflated entries are compressed with ZIP_COMPRESSLEVEL."""
+    tool_name, tool_path = tool_setup
+    compressobj_spy = mocker.spy(zlib, "compressobj")
+
+    result, error = create_agent_resource_folder_zip(tool_name, tool_path)
+    assert error is None
+
+    assert compressobj_spy.call_count == 3
+    assert all(call.args[0] == packager.ZIP_COMPRESSLEVEL for call in compressobj_spy.call_args_list)
+
+
+def test_create_tool_folder_zip_pins_entry_permissions(tool_setup):
+    """Test that every entry gets the same permissions, whatever the mode of the file on disk."""
+    tool_name, tool_path = tool_setup
+    os.chmod(f"{tool_path}/tool.py", 0o700)
+
+    result, error = create_agent_resource_folder_zip(tool_name, tool_path)
+    assert error is None
+
+    with ZipFile(result, "r") as z:
+        assert {info.external_attr for info in z.infolist()} == {0o644 << 16}
@@ -50,11 +50,8 @@ class Spinner(object):
             self.spin_thread.join()
 
             if self.tty_output:
-                if self.beep:
-                    self.stream.write("\7")
-                    self.stream.flush()
                 spaces = " " * (len(self.spinner_template) - 1)
-                self.stream.write(spaces + "\b")
+                self.stream.write(("\7" if self.beep else "") + spaces + "\b")
                 self.stream.flush()
 
         if self.keep_label and self.label:
@@ -62,15 +59,15 @@ class Spinner(object):
             click.echo(text, file=self.stream)
 
     def init_spin(self) -> None:
+        # the backspace erasing a frame is sent together with the next one, one write per frame
+        erase = ""
         while not self.stop_running.is_set():
-            self.stream.write(self.spinner_template % next(self.spinner))
+            self.stream.write(erase + self.spinner_template % next(self.spinner))
             self.stream.flush()
             self.stop_running.wait(self.delay)
-            self.stream.write("\b")
-            self.stream.flush()
+            erase = "\b"
 
-        self.stream.write(" ")
-        self.stream.write("\b")
+        self.stream.write(erase + " \b")
         self.stream.flush()
 
     def __enter__(self) -> "Spinner":
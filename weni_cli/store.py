@@ -15,7 +15,7 @@ STORE_CLI_BASE_URL = "cli_base_url"
 
 
 class Store:
-    file_path = f"{Path.home()}{os.sep}.weni_cli"
+    file_path = os.path.join(Path.home(), ".weni_cli")
 
     # Validates that the file exists, if it does not exist, it creates it with an empty dictionary
     def __init__(self):
@@ -25,23 +25,18 @@ class Store:
             if not content:
                 file.write("{}")
 
-            file.close()
+        # commands read several keys per run, the file is parsed once and get() is served from memory
+        self._content = json.loads(content or "{}")
 
     def get(self, key, default=None):
-        with click.open_file(self.file_path, "r") as file:
-            content = json.loads(file.read())
-            file.close()
-            return content.get(key, default)
+        return self._content.get(key, default)
 
     def set(self, key, value):
-        content = {}
-        with click.open_file(self.file_path, "r") as file:
-            content = json.loads(file.read())
-            file.close()
-
-        with click.open_file(self.file_path, "w") as file:
-            content[key] = value
-            file.write(json.dumps(content, ensure_ascii=False))
-            file.close()
+        self._content[key] = value
+
+        # atomic writes go to a temporary file that replaces the store on close, an interrupted write never
+        # leaves a truncated store behind
+        with click.open_file(self.file_path, "w", atomic=True) as file:
+            file.write(json.dumps(self._content, ensure_ascii=False))
 
         return True
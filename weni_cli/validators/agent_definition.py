@@ -1,17 +1,20 @@
+import functools
 import re
 from typing import Any, Optional
 import regex
-import yaml
 
 from slugify import slugify
 
 from weni_cli.validators.source import validate_entrypoint
+from weni_cli.validators.yaml_loader import read_yaml_file
 
 MIN_INSTRUCTION_LENGTH = 40
 MIN_GUARDRAIL_LENGTH = 40
 MAX_AGENT_NAME_LENGTH = 55
 MAX_TOOL_NAME_LENGTH = 40
 MAX_TOOL_DESCRIPTION_LENGTH = 200
+AVAILABLE_PARAMETER_TYPES = frozenset({"string", "number", "integer", "boolean", "array"})
+
 AVAILABLE_COMPONENTS = [
     "cta_message",
     "quick_replies",
@@ -207,27 +210,25 @@ def validate_agent_definition_schema(data):
                     if not isinstance(param_data, dict):
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' data must be an object in the agent definition file"
 
+                    description = param_data.get("description")
+                    param_type = param_data.get("type")
+                    contact_field = param_data.get("contact_field")
+
                     # Check required parameter fields
                     # Validate description (required, must be string)
-                    if not param_data.get("description"):
+                    if not description:
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' is missing required field 'description' in the agent definition file"
-                    if not isinstance(param_data["description"], str):
+                    if not isinstance(description, str):
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' description must be a string in the agent definition file"
 
                     # Validate type (required, must be string)
-                    if not param_data.get("type"):
+                    if not param_type:
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' is missing required field 'type' in the agent definition file"
-                    if not isinstance(param_data["type"], str):
+                    if not isinstance(param_type, str):
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' type must be a string in the agent definition file"
 
                     # Check allowed types
-                    if param_data["type"] not in [
-                        "string",
-                        "number",
-                        "integer",
-                        "boolean",
-                        "array",
-                    ]:
+                    if param_type not in AVAILABLE_PARAMETER_TYPES:
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' type must be one of: string, number, integer, boolean, array in the agent definition file"
 
                     # Validate required if present (must be boolean)
@@ -235,24 +236,20 @@ def validate_agent_definition_schema(data):
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' required field must be a boolean in the agent definition file"
 
                     # Validate contact_field if present (must be boolean)
-                    if "contact_field" in param_data and not isinstance(param_data["contact_field"], bool):
+                    if "contact_field" in param_data and not isinstance(contact_field, bool):
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' contact_field must be a boolean in the agent definition file"
 
                     # If contact_field is True, validate parameter name
+                    if not contact_field:
+                        continue
 
-                    if param_data.get("contact_field") and not ContactFieldValidator.has_valid_contact_field_name(
-                        param_name
-                    ):
+                    if not ContactFieldValidator.has_valid_contact_field_name(param_name):
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' name must match the regex of a valid contact field: {re.escape(ContactFieldValidator.CONTACT_FIELD_NAME_REGEX)} in the agent definition file"
 
-                    if param_data.get("contact_field") and not ContactFieldValidator.has_valid_contact_field_length(
-                        param_name
-                    ):
+                    if not ContactFieldValidator.has_valid_contact_field_length(param_name):
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' name must be {ContactFieldValidator.CONTACT_FIELD_MAX_LENGTH} characters or less in the agent definition file"
 
-                    if param_data.get("contact_field") and not ContactFieldValidator.has_allowed_parameter_name(
-                        param_name
-                    ):
+                    if not ContactFieldValidator.has_allowed_parameter_name(param_name):
                         return f"Agent '{agent_key}': tool '{tool_name}': parameter '{param_name}' name must not be a reserved contact field name in the agent definition file\nRestricted contact field names: {ContactFieldValidator.RESERVED_CONTACT_FIELDS}"
 
 
@@ -526,8 +523,7 @@ def validate_agent_credentials(agent_key: str, credentials: Any) -> Optional[str
 
 def load_yaml_file(path) -> tuple[Any, Optional[Exception]]:
     try:
-        with open(path, "r") as file:
-            return yaml.safe_load(file), None
+        return read_yaml_file(path), None
     except Exception as error:
         return None, error
 
@@ -602,35 +598,43 @@ def validate_active_test_definition(data: Any) -> Optional[str]:
     return None
 
 
-# Updates the tools in the definition to be an array of objects containing name, path and slug
+# Agent and tool names are slugified on every push, memoize since the same names repeat
+_slugify = functools.lru_cache(maxsize=512)(slugify)
+
+
+# Returns a copy of the definition with the tools of each agent as an array of objects containing name, path and slug.
+# The given definition is left untouched, callers can keep using the data they loaded.
 def format_definition(definition: dict) -> Optional[dict]:
-    agents = definition.get("agents", {})
+    formatted_agents = {}
 
-    for agent in agents:
-        tools = agents[agent].get("tools", {})
+    for agent_key, agent_data in definition.get("agents", {}).items():
         agent_tools = []
-        for tool in tools:
+        for tool in agent_data.get("tools", {}):
             for tool_key, tool_data in tool.items():
-                tool_slug = slugify(tool_data.get("name"))
+                tool_name = tool_data.get("name")
                 agent_tools.append(
                     {
                         "key": tool_key,
-                        "slug": tool_slug,
-                        "name": tool_data.get("name"),
+                        "slug": _slugify(tool_name),
+                        "name": tool_name,
                         "source": tool_data.get("source"),
                         "description": tool_data.get("description"),
                         "parameters": tool_data.get("parameters"),
                     }
                 )
 
-        agents[agent]["tools"] = agent_tools
-        agents[agent]["slug"] = slugify(agents[agent].get("name"))
+        formatted_agents[agent_key] = {**agent_data, "slug": _slugify(agent_data.get("name")), "tools": agent_tools}
+
+    formatted_definition = dict(definition)
+    if "agents" in definition:
+        formatted_definition["agents"] = formatted_agents
 
-    return definition
+    return formatted_definition
 
 
 class ContactFieldValidator:
     CONTACT_FIELD_NAME_REGEX = r"^[a-z][a-z0-9_]*$"
+    CONTACT_FIELD_NAME_PATTERN = regex.compile(CONTACT_FIELD_NAME_REGEX, regex.V0)
     CONTACT_FIELD_MAX_LENGTH = 36
     RESERVED_CONTACT_FIELDS = [
         "id",
@@ -670,7 +674,7 @@ class ContactFieldValidator:
 
     @staticmethod
     def has_valid_contact_field_name(parameter_name) -> bool:
-        if not regex.match(ContactFieldValidator.CONTACT_FIELD_NAME_REGEX, parameter_name, regex.V0):
+        if not ContactFieldValidator.CONTACT_FIELD_NAME_PATTERN.match(parameter_name):
             return False
         return True
 
@@ -1,6 +1,6 @@
-import re
 from typing import Any, Optional
-import yaml
+
+from weni_cli.validators.yaml_loader import read_yaml_file
 
 # Constants for channel validation
 MAX_CHANNEL_NAME_LENGTH = 100
@@ -12,6 +12,7 @@ AVAILABLE_CONTENT_TYPES = [
     "application/x-www-form-urlencoded",
     "multipart/form-data",
 ]
+VALID_URL_PREFIXES = ("http://", "https://")
 
 
 def validate_channel_definition_schema(data):
@@ -111,8 +112,7 @@ def validate_channel_definition_schema(data):
         if not config["send_url"]:
             return f"Channel at index {channel_idx}: 'config.send_url' must not be empty in the channel definition file"
         # Basic URL validation
-        url_pattern = re.compile(r"^https?://")
-        if not url_pattern.match(config["send_url"]):
+        if not config["send_url"].startswith(VALID_URL_PREFIXES):
             return f"Channel at index {channel_idx}: 'config.send_url' must be a valid URL starting with http:// or https:// in the channel definition file"
 
         # Validate send_method (required, must be string and valid HTTP method)
@@ -157,8 +157,7 @@ def load_yaml_file(path) -> tuple[Any, Optional[Exception]]:
         tuple: (parsed_data, error) where error is None if successful
     """
     try:
-        with open(path, "r") as file:
-            return yaml.safe_load(file), None
+        return read_yaml_file(path), None
     except Exception as error:
         return None, error
 
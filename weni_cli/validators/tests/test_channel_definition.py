@@ -296,3 +296,28 @@ class TestLoadChannelDefinition:
         data, error = load_channel_definition("nonexistent.yaml")
         assert error is not None
         assert data is None
+
+    def test_load_invalid_yaml_reports_location(self):
+        """Test that a malformed file keeps the detailed PyYAML error message."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("invalid_channel_definition.yaml", "w") as f:
+                f.write("channels:\n  - name: Test: Channel\n")
+
+            data, error = load_channel_definition("invalid_channel_definition.yaml")
+
+        assert data is None
+        assert "mapping values are not allowed here" in str(error)
+        assert 'in "invalid_channel_definition.yaml", line 2' in str(error)
+
+    def test_load_utf8_channel_definition(self):
+        """Test that UTF-8 content is decoded regardless of the locale encoding."""
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open("channel_definition.yaml", "wb") as f:
+                f.write("channels:\n  - name: Canal de Atenção\n".encode("utf-8"))
+
+            data, error = load_channel_definition("channel_definition.yaml")
+
+        assert error is None
+        assert data["channels"][0]["name"] == "Canal de Atenção"
@@ -1,3 +1,4 @@
+import os
 import re
 import pytest
 import regex
@@ -138,6 +139,7 @@ def test_load_yaml_file_invalid(sample_definition_file):
     # Check that we got an error
     assert error is not None
     assert "mapping values are not allowed here" in str(error)
+    assert os.path.basename(sample_definition_file["invalid_path"]) in str(error)
 
 
 def test_load_yaml_file_empty(sample_definition_file):
@@ -185,6 +187,18 @@ def test_format_definition_valid(valid_definition):
     assert tools[0]["name"] == "Test Tool"
 
 
+def test_format_definition_does_not_mutate_input(valid_definition):
+    """Test that formatting returns a new definition and leaves the parsed one untouched."""
+    original_tools = valid_definition["agents"]["test_agent"]["tools"]
+
+    result = format_definition(valid_definition)
+
+    assert result is not valid_definition
+    assert valid_definition["agents"]["test_agent"]["tools"] is original_tools
+    assert "slug" not in valid_definition["agents"]["test_agent"]
+    assert result["agents"]["test_agent"]["tools"][0]["key"] == "test_tool"
+
+
 def test_format_definition_no_tools():
     """Test formatting a definition with no tools."""
     definition = {
@@ -0,0 +1,32 @@
+import pytest
+import yaml
+
+from weni_cli.validators import yaml_loader
+from weni_cli.validators.yaml_loader import load_yaml_bytes, read_yaml_file
+
+
+def test_load_yaml_bytes_parses_content():
+    """Test that byte content is parsed into Python data."""
+    assert load_yaml_bytes(b"tests:\n  test_1:\n    cep: '01311000'\n", "test.yaml") == {
+        "tests": {"test_1": {"cep": "01311000"}}
+    }
+
+
+def test_load_yaml_bytes_reports_the_pure_python_error(mocker):
+    """Test that parse errors come from the pure Python loader and name the file."""
+    safe_load_spy = mocker.spy(yaml_loader.yaml, "safe_load")
+
+    with pytest.raises(yaml.YAMLError) as error:
+        load_yaml_bytes(b"agents:\n  name: Test: Agent\n", "definition.yaml")
+
+    assert "mapping values are not allowed here" in str(error.value)
+    assert 'in "definition.yaml", line 2' in str(error.value)
+    assert safe_load_spy.call_count == (0 if yaml_loader.YAML_LOADER is yaml.SafeLoader else 1)
+
+
+def test_read_yaml_file_decodes_utf8_content(tmp_path):
+    """Test that files are read as bytes and decoded as UTF-8 regardless of the locale."""
+    path = tmp_path / "definition.yaml"
+    path.write_bytes("name: Canal de Atenção\n".encode("utf-8"))
+
+    assert read_yaml_file(str(path)) == {"name": "Canal de Atenção"}
@@ -0,0 +1,37 @@
+"""YAML parsing shared by the definition validators.
+
+Agent, channel and ticketer definitions are all parsed here so they use the
+same loader and report parse errors the same way.
+"""
+
+from io import BytesIO
+from typing import Any
+
+import yaml
+
+# libyaml's loader is several times faster than the pure Python one, use it when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml_bytes(content: bytes, name: str) -> Any:
+    """Parse ``content`` as YAML, using ``name`` as the file name in error messages."""
+    # PyYAML detects the encoding of byte input itself, the named stream keeps the file name in errors
+    stream = BytesIO(content)
+    stream.name = name
+
+    try:
+        return yaml.load(stream, Loader=YAML_LOADER)
+    except yaml.YAMLError:
+        if YAML_LOADER is yaml.SafeLoader:
+            raise
+
+        # libyaml errors are less descriptive, parse again with the pure Python loader so the
+        # user gets its more helpful message
+        stream.seek(0)
+        return yaml.safe_load(stream)
+
+
+def read_yaml_file(path) -> Any:
+    """Read ``path`` in binary mode and parse it, PyYAML detects the encoding instead of the locale."""
+    with open(path, "rb") as file:
+        return load_yaml_bytes(file.read(), path)